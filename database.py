@@ -8,8 +8,13 @@ user-specified criteria.
 
 Under normal circumstances, the main module creates one NEODatabase from the
 data on NEOs and close approaches extracted by `extract.load_neos` and
-`extract.load_approaches`.
+`extract.load_approaches`. Alternatively, a `ColumnarNEODatabase` can be built
+from the NumPy columns produced by `extract.load_approaches_soa`, which keeps
+close approaches as arrays and only creates `CloseApproach` objects for results.
 """
+from filters import apply_filters_soa
+from models import CloseApproach
+
 
 class NEODatabase:
     """
@@ -113,9 +118,100 @@ class NEODatabase:
         The `CloseApproach` objects are generated in internal order, which isn't
         guaranteed to be sorted meaninfully, although is often sorted by time.
 
+        Filters are checked in order, stopping at the first one that fails.
+        `create_filters` returns a single predicate from `filters.fuse_filters`,
+        whose `and` chain does that short-circuiting inline, with the
+        comparisons ordered from most to least selective.
+
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
         for approach in self._approaches:
             if all(f(approach) for f in filters):
-                yield approach
\ No newline at end of file
+                yield approach
+
+class ColumnarNEODatabase:
+    """
+    A database of near-Earth objects whose close approaches are stored column-wise.
+
+    Rather than holding one `CloseApproach` per row, this keeps the approach
+    data as parallel NumPy arrays (see `extract.load_approaches_soa`), with the
+    linked NEO's diameter and hazardous flag broadcast into per-approach
+    columns. Queries are evaluated as vectorized masks by
+    `filters.apply_filters_soa`, and `CloseApproach` objects are only built for
+    the matching rows that are actually consumed.
+
+    Looking up NEOs is delegated to an `NEODatabase` over the same NEOs, but
+    the NEOs' `.approaches` collections are left empty. Since queries take
+    criteria rather than filters, this isn't a drop-in `NEODatabase`: it has
+    `query_criteria` instead of `query`.
+    """
+
+    def __init__(self, neos, columns):
+        """Create a new `ColumnarNEODatabase`.
+
+        :param neos: A collection of `NearEarthObject`s.
+        :param columns: A dict of equal-length NumPy arrays, as from `load_approaches_soa`.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("ColumnarNEODatabase requires numpy") from None
+
+        self._neo_database = NEODatabase(neos, ())
+
+        neos_lookup = {neo.designation: neo for neo in neos}
+        linked = [neos_lookup.get(designation) for designation in columns['des']]
+
+        self._columns = dict(columns)
+        self._linked_neos = np.array(linked, dtype=object)
+        self._columns['diameter'] = np.array(
+            [neo.diameter if neo else float('nan') for neo in linked], dtype=np.float64)
+        self._columns['hazardous'] = np.array(
+            [bool(neo and neo.hazardous) for neo in linked], dtype=bool)
+
+    def get_neo_by_designation(self, designation):
+        """
+        Find and return an NEO by its primary designation, as `NEODatabase` does.
+
+        :param designation: The primary designation of the NEO to search for.
+        :return: The `NearEarthObject` with the desired primary designation, or `None`.
+        """
+        return self._neo_database.get_neo_by_designation(designation)
+
+    def get_neo_by_name(self, name):
+        """
+        Find and return an NEO by its name, as `NEODatabase` does.
+
+        :param name: The name, as a string, of the NEO to search for.
+        :return: The `NearEarthObject` with the desired name, or `None`.
+        """
+        return self._neo_database.get_neo_by_name(name)
+
+    def query_criteria(self, criteria=None, n=None, use_numba=False):
+        """
+        Query close approaches to generate those that match user-specified criteria.
+
+        Unlike `NEODatabase.query`, this takes the keyword arguments of
+        `create_filters` as a mapping rather than a collection of filters, so
+        that they can be evaluated column-wise.
+
+        :param criteria: A mapping of `create_filters` keyword arguments to values.
+        :param n: The maximum number of approaches to produce, or None (or 0) for all.
+        :param use_numba: Whether to build the match mask with the Numba kernel.
+        :return: A stream of matching `CloseApproach` objects.
+        """
+        mask = apply_filters_soa(self._columns, criteria or {}, use_numba=use_numba)
+        indices = mask.nonzero()[0]
+        if n:
+            indices = indices[:n]
+
+        columns = self._columns
+        for i in indices:
+            yield CloseApproach(
+                designation=columns['des'][i],
+                time=columns['cd'][i],
+                distance=float(columns['dist'][i]),
+                velocity=float(columns['vrel'][i]),
+                neo=self._linked_neos[i],
+            )
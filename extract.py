@@ -6,45 +6,163 @@ described in the project instructions, into a collection of `NearEarthObject`s.
 
 The `load_approaches` function extracts close approach data from a JSON file,
 formatted as described in the project instructions, into a collection of
-`CloseApproach` objects.
+`CloseApproach` objects. The `load_approaches_soa` function reads the same file
+into parallel NumPy columns instead, for use with `ColumnarNEODatabase`.
 
 The main module calls these functions with the arguments provided at the command
 line, and uses the resulting collections to build an `NEODatabase`.
 """
 import csv
 import json
+from operator import itemgetter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
+    pc = None
+    pv = None
+
+from helpers import cd_to_datetime64
 from models import NearEarthObject, CloseApproach
 
+# Maps the CSV's `pha` flag to `hazardous`; anything but 'Y' is not hazardous.
+_HAZARDOUS = {'Y': True}
+
+
+def _load_neos_arrow(neo_csv_path):
+    """
+    Read near-Earth object information from a CSV file with pyarrow's C parser.
+
+    Only the four columns we need are parsed, and the NEOs are built in a single
+    pass over the resulting columns instead of one dict per row.
+
+    :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
+    :return: A list of `NearEarthObject`s.
+    """
+    table = pv.read_csv(
+        neo_csv_path,
+        convert_options=pv.ConvertOptions(
+            include_columns=['pdes', 'name', 'diameter', 'pha'],
+            column_types={
+                'pdes': pa.string(),
+                'name': pa.string(),
+                'diameter': pa.float64(),
+                'pha': pa.string(),
+            },
+            null_values=[''],
+            strings_can_be_null=True,
+        ),
+    )
+
+    return [
+        NearEarthObject(
+            designation=pdes,
+            name=name or None,
+            diameter=diameter if diameter is not None else float('nan'),
+            hazardous=hazardous,
+        )
+        for pdes, name, diameter, hazardous in zip(
+            table.column('pdes').to_pylist(),
+            table.column('name').to_pylist(),
+            table.column('diameter').to_pylist(),
+            # Compare the whole column at once; a missing flag isn't hazardous.
+            pc.fill_null(pc.equal(table.column('pha'), 'Y'), False).to_pylist(),
+        )
+    ]
+
+
+def _load_neos_csv(neo_csv_path):
+    """
+    Read near-Earth object information from a CSV file with the `csv` module.
+
+    :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
+    :return: A list of `NearEarthObject`s.
+    """
+    with open(neo_csv_path, mode='r') as file:
+        csv_line = csv.reader(file)
+
+        # Look up the columns we need once, then index each row list directly.
+        header = next(csv_line)
+        i_name = header.index('name')
+        i_pdes = header.index('pdes')
+        i_diameter = header.index('diameter')
+        i_pha = header.index('pha')
+
+        return [
+            NearEarthObject(
+                name = row[i_name] or None,
+                designation=row[i_pdes],
+                diameter=row[i_diameter],
+                hazardous=_HAZARDOUS.get(row[i_pha], False),
+            )
+            for row in csv_line
+        ]
+
 
 def load_neos(neo_csv_path):
     """
     Read near-Earth object information from a CSV file.
 
+    Uses pyarrow when it's installed, and falls back to the `csv` module otherwise.
+    pyarrow rejects the whole file if any diameter isn't a number, so in that
+    case the file is re-read with the `csv` module, which stores those as NaN.
+
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
     neo_list = []
 
     try:
-        with open(neo_csv_path, mode='r') as file:
-            csv_line = csv.DictReader(file)
-
-            for row in csv_line:
-                neObject = NearEarthObject(
-                    name = row['name'] or None, 
-                    designation=row['pdes'], 
-                    diameter=row['diameter'],
-                    hazardous= row['pha'] == 'Y',
-                )
-                neo_list.append(neObject)
-                
+        if pv is not None:
+            try:
+                neo_list = _load_neos_arrow(neo_csv_path)
+            except pa.ArrowInvalid:
+                neo_list = _load_neos_csv(neo_csv_path)
+        else:
+            neo_list = _load_neos_csv(neo_csv_path)
+
     except Exception as ex:
         print(f"couldnt open/parse csv file bcz: {ex}")
 
     return neo_list if neo_list else None
 
 
+def _read_json(json_path):
+    """
+    Read a JSON file, using orjson when it's installed.
+
+    :param json_path: A path to a JSON file.
+    :return: The decoded JSON document.
+    """
+    if orjson is not None:
+        with open(json_path, mode='rb') as file:
+            return orjson.loads(file.read())
+    with open(json_path, mode='r') as file:
+        return json.load(file)
+
+
+def _cad_columns(fields):
+    """
+    Build a getter for the close approach columns we use from a CAD `fields` header.
+
+    The header is searched once, and the returned getter pulls the `des`, `cd`,
+    `dist` and `v_rel` values out of a data row (a list) in that order.
+
+    :param fields: The list of field names from a CAD JSON document.
+    :return: A callable mapping a data row to a `(des, cd, dist, v_rel)` tuple.
+    """
+    return itemgetter(fields.index('des'), fields.index('cd'),
+                      fields.index('dist'), fields.index('v_rel'))
+
+
 def load_approaches(cad_json_path):
     """
     Read close approach data from a JSON file.
@@ -54,24 +172,54 @@ def load_approaches(cad_json_path):
     """
     aproach_list = []
     try:
-        with open(cad_json_path, mode='r') as file:
-            json_data = json.load(file)
-
-        #create dict w fields as key/data as value
-        entry_dict = [dict(zip(json_data["fields"], value)) for value in json_data["data"]]
-
-        for entry in entry_dict:
-                 
-            # Create CloseApproach instance
-            apprObj = CloseApproach(
-                designation = entry['des'],
-                time = entry['cd'],
-                distance = float(entry['dist']),  
-                velocity = float(entry['v_rel'])
+        json_data = _read_json(cad_json_path)
+
+        # Pick the columns we need straight out of each row list.
+        columns = _cad_columns(json_data["fields"])
+
+        aproach_list = [
+            CloseApproach(
+                designation = des,
+                time = cd,
+                distance = float(dist),
+                velocity = float(v_rel)
             )
-            aproach_list.append(apprObj)
-            
+            for des, cd, dist, v_rel in map(columns, json_data["data"])
+        ]
+
     except Exception as ex:
         print(f"couldnt open/parse json file bcz: {ex}")
          
-    return aproach_list if aproach_list else None
\ No newline at end of file
+    return aproach_list if aproach_list else None
+
+
+def load_approaches_soa(cad_json_path):
+    """
+    Read close approach data from a JSON file into parallel NumPy columns.
+
+    Instead of one `CloseApproach` per row, this returns a struct-of-arrays
+    that `filters.apply_filters_soa` can evaluate with vectorized comparisons.
+    The raw `cd` strings are kept so that `CloseApproach` objects can be built
+    later for just the rows that survive a query.
+
+    :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :return: A dict of equal-length arrays keyed by 'des', 'cd', 'time', 'dist' and 'vrel'.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("load_approaches_soa requires numpy") from None
+
+    json_data = _read_json(cad_json_path)
+    columns = _cad_columns(json_data["fields"])
+
+    # Transpose the picked rows into one tuple per column.
+    des, cds, dists, v_rels = tuple(zip(*map(columns, json_data["data"]))) or ((), (), (), ())
+
+    return {
+        'des': np.array(des, dtype=object),
+        'cd': np.array(cds, dtype=object),
+        'time': cd_to_datetime64(cds),
+        'dist': np.array(dists, dtype=np.float64),
+        'vrel': np.array(v_rels, dtype=np.float64),
+    }
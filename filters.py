@@ -7,16 +7,27 @@ the main module and originate from the user's command-line options.
 
 This function can be thought to return a collection of instances of subclasses
 of `AttributeFilter` - a 1-argument callable (on a `CloseApproach`) constructed
-from a comparator (from the `operator` module), a reference value, and a class
-method `get` that subclasses can override to fetch an attribute of interest from
+from a comparator (from the `operator` module), a reference value, and a `get`
+function that subclasses can override to fetch an attribute of interest from
 the supplied `CloseApproach`.
 
+Rather than returning those filters as-is, `create_filters` fuses the active
+ones into a single compiled predicate, so that `query` makes one call per
+approach instead of one call (plus a `get` and an operator call) per filter.
+
+For approaches stored column-wise (see `extract.load_approaches_soa`), the
+`apply_filters_soa` function evaluates the same criteria as vectorized NumPy
+comparisons and returns a boolean mask.
+
 The `limit` function simply limits the maximum number of values produced by an
 iterator.
 """
-from operator import eq, ge, le
+from operator import attrgetter, eq, ge, le
 import itertools
 
+# Source form of each supported comparator, used to build fused predicates.
+_OP_SYMBOLS = {eq: '==', ge: '>=', le: '<='}
+
 class UnsupportedCriterionError(NotImplementedError):
     """A filter criterion is unsupported."""
 
@@ -33,11 +44,28 @@ class AttributeFilter:
     calling the filter (with __call__) executes `get(approach) OP value` (in
     infix notation).
 
-    Concrete subclasses can override the `get` classmethod to provide custom
-    behavior to fetch a desired attribute from the given `CloseApproach`.
+    Concrete subclasses set `attribute` to the (possibly dotted) path of the
+    attribute of interest on a `CloseApproach`. From it, `get` becomes a static
+    `operator.attrgetter`, and `expr` becomes the equivalent source expression
+    on an approach named `a`, which `fuse_filters` uses to compile several
+    filters into one predicate. Subclasses can instead override `get` directly,
+    in which case `expr` is None and `fuse_filters` calls the filter itself.
 
     """
 
+    attribute = None
+    expr = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Derive `get` and `expr` from a subclass's `attribute` path."""
+        super().__init_subclass__(**kwargs)
+        if 'get' in cls.__dict__:
+            # An overridden `get` no longer matches an inherited `expr`.
+            cls.expr = None
+        elif cls.attribute is not None:
+            cls.get = staticmethod(attrgetter(cls.attribute))
+            cls.expr = f"a.{cls.attribute}"
+
     def __init__(self, op, value):
         """Construct a new `AttributeFilter` from an binary predicate and a reference value.
 
@@ -51,10 +79,21 @@ class AttributeFilter:
         """
         self.op = op
         self.value = value
+        self._call = self._bind(op, value)
 
     def __call__(self, approach):
         """Invoke `self(approach)`."""
-        return self.op(self.get(approach), self.value)
+        return self._call(approach)
+
+    def _bind(self, op, value):
+        """Build the predicate behind `__call__`, with `op` and `value` bound as closure locals.
+
+        :param op: A 2-argument predicate comparator (such as `operator.le`).
+        :param value: The reference value to compare against.
+        :return: A 1-argument callable predicate on a `CloseApproach`.
+        """
+        get = self.get
+        return lambda approach: op(get(approach), value)
 
     @classmethod
     def get(cls, approach):
@@ -74,7 +113,7 @@ class AttributeFilter:
 
 
 """
-Subclasses of AttributeFilter which override its get() method to get an attribute of
+Subclasses of AttributeFilter which set its `attribute` path to get an attribute of
 interest from the supplied `CloseApproach`
 
 Args: approach: a CloseApproach object
@@ -89,18 +128,7 @@ class DateFilter(AttributeFilter):
     time attribute.
     """
 
-    @classmethod
-    def get(cls, approach):
-        """
-        Get the date from the provided approach.
-
-        Args:
-            approach: An object that has a time attribute.
-
-        Returns:
-            The date component of the approach's time.
-        """
-        return approach.time.date()
+    attribute = '_date'
 
 class DistFilter(AttributeFilter):
     """
@@ -111,18 +139,7 @@ class DistFilter(AttributeFilter):
 
     """
 
-    @classmethod
-    def get(cls, approach):
-        """
-        Get the distance from the provided approach.
-
-        Args:
-            approach: An object that has a distance attribute.
-
-        Returns:
-            The distance of the approach.
-        """
-        return approach.distance
+    attribute = 'distance'
 
 class VeloFilter(AttributeFilter):
     """
@@ -133,18 +150,7 @@ class VeloFilter(AttributeFilter):
 
     """
 
-    @classmethod
-    def get(cls, approach):
-        """
-        Get the velocity from the provided approach.
-
-        Args:
-            approach: An object that has a velocity attribute.
-
-        Returns:
-            The velocity of the approach.
-        """
-        return approach.velocity 
+    attribute = 'velocity'
 
 class DiamFilter(AttributeFilter):
     """
@@ -156,18 +162,7 @@ class DiamFilter(AttributeFilter):
 
     """
 
-    @classmethod
-    def get(cls, approach):
-        """
-        Get the diameter from the provided approach's NEO.
-
-        Args:
-            approach: An object that has a neo attribute with a diameter.
-
-        Returns:
-            The diameter of the NEO associated with the approach.
-        """
-        return approach.neo.diameter
+    attribute = 'neo.diameter'
 
 class HazFilter(AttributeFilter):
     """
@@ -179,18 +174,11 @@ class HazFilter(AttributeFilter):
 
     """
 
-    @classmethod
-    def get(cls, approach):
-        """
-        Determine if the NEO associated with the approach is hazardous.
+    attribute = 'neo.hazardous'
 
-        Args:
-            approach: An object that has a neo attribute with a hazardous flag.
 
-        Returns:
-            A boolean indicating whether the NEO is hazardous.
-        """
-        return approach.neo.hazardous
+# Estimated selectivity of each filter type, most selective (rejects the most) first.
+_FILTER_PRIORITY = {HazFilter: 0, DateFilter: 1, DiamFilter: 2, DistFilter: 3, VeloFilter: 4}
 
 
 def create_filters(date=None, start_date=None, end_date=None,
@@ -212,8 +200,9 @@ def create_filters(date=None, start_date=None, end_date=None,
     `hazardous=False`, not to be confused with `hazardous=None`).
 
     The return value must be compatible with the `query` method of `NEODatabase`
-    because the main module directly passes this result to that method. For now,
-    this can be thought of as a collection of `AttributeFilter`s.
+    because the main module directly passes this result to that method. The
+    active `AttributeFilter`s are fused into a single predicate with
+    `fuse_filters`, so this is a list holding at most one callable.
 
     :param date: A `date` on which a matching `CloseApproach` occurs.
     :param start_date: A `date` on or after which a matching `CloseApproach` occurs.
@@ -269,8 +258,212 @@ def create_filters(date=None, start_date=None, end_date=None,
         if value is not None:
             filters.append(filter_class(op, value))
 
-    return filters
+    # Put the most selective filters first so evaluation short-circuits early.
+    filters.sort(key=_selectivity_rank)
+
+    return [fuse_filters(filters)] if filters else []
+
+
+def _selectivity_rank(f):
+    """Rank a filter by how selective it's expected to be (lowest first).
+
+    Filter types are ordered by a static priority, and within a type an
+    equality check comes before a range comparison.
+    """
+    return (_FILTER_PRIORITY.get(type(f), len(_FILTER_PRIORITY)), 0 if f.op is eq else 1)
+
+
+def fuse_filters(filters):
+    """Compile a sequence of `AttributeFilter`s into a single predicate.
+
+    The generated function evaluates every comparison inline, in the given
+    order, joined with `and` - so `fuse_filters(filters)(approach)` is
+    equivalent to `all(f(approach) for f in filters)`. Reference values are
+    bound as names in the function's namespace rather than formatted into its
+    source. A filter without an `expr`, or with an operator that has no source
+    form, is bound into the namespace too and called as-is.
 
+    :param filters: A sequence of `AttributeFilter`s.
+    :return: A 1-argument callable predicate on a `CloseApproach`.
+    """
+    namespace = {}
+    parts = []
+    for i, f in enumerate(filters):
+        if f.expr is None or f.op not in _OP_SYMBOLS:
+            name = f"_f{i}"
+            namespace[name] = f
+            parts.append(f"{name}(a)")
+        else:
+            name = f"_v{i}"
+            namespace[name] = f.value
+            parts.append(f"{f.expr} {_OP_SYMBOLS[f.op]} {name}")
+
+    source = "lambda a: " + (" and ".join(parts) if parts else "True")
+    return eval(source, namespace)
+
+
+# The compiled mask kernel: None until first requested, False if numba is missing.
+_mask_kernel = None
+
+
+def _get_mask_kernel():
+    """Return the Numba mask kernel, compiling it (or loading it from cache) on first use.
+
+    numba is imported here rather than at module level, so that importing this
+    module stays cheap for callers that never touch the columnar backend.
+
+    :return: The compiled kernel, or None if numba isn't installed.
+    """
+    global _mask_kernel
+    if _mask_kernel is None:
+        try:
+            import numpy as np
+            from numba import njit, prange
+        except ImportError:
+            _mask_kernel = False
+            return None
+
+        @njit(parallel=True, cache=True)
+        def kernel(days, dist, vrel, diameter, hazardous,
+                   use_days, day_min, day_max,
+                   dist_min, dist_max, vrel_min, vrel_max,
+                   use_diameter, diameter_min, diameter_max,
+                   use_hazardous, hazardous_value):
+            """Compute the boolean match mask for columnar approaches in one parallel pass."""
+            n = dist.shape[0]
+            out = np.empty(n, np.bool_)
+            for i in prange(n):
+                keep = (dist[i] >= dist_min) & (dist[i] <= dist_max) & (vrel[i] >= vrel_min) & (vrel[i] <= vrel_max)
+                if use_days:
+                    keep = keep & (days[i] >= day_min) & (days[i] <= day_max)
+                if use_diameter:
+                    keep = keep & (diameter[i] >= diameter_min) & (diameter[i] <= diameter_max)
+                if use_hazardous:
+                    keep = keep & (hazardous[i] == hazardous_value)
+                out[i] = keep
+            return out
+
+        _mask_kernel = kernel
+    return _mask_kernel or None
+
+
+def apply_filters_soa(columns, criteria, use_numba=False):
+    """Evaluate user-specified criteria against columnar close approach data.
+
+    `criteria` uses the same keyword names as `create_filters`; entries that
+    are `None` are ignored. Date criteria compare against the `time` column,
+    distance and velocity against `dist` and `vrel`, and diameter and
+    hazardous against per-approach `diameter` and `hazardous` columns, which
+    the caller must supply (as `ColumnarNEODatabase` does).
+
+    The Numba kernel is opt-in: compiling it (or loading it from cache) takes
+    far longer than a single NumPy pass, so it only pays off when many queries
+    run in the same process. Without numba, the NumPy path is used regardless.
+
+    :param columns: A dict of equal-length NumPy arrays, as from `load_approaches_soa`.
+    :param criteria: A mapping of `create_filters` keyword arguments to values.
+    :param use_numba: Whether to evaluate the mask with the parallel Numba kernel.
+    :return: A boolean NumPy array that is True for each matching approach.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("apply_filters_soa requires numpy") from None
+
+    # Map each criterion to the column it reads and the comparison it makes.
+    column_mappings = {
+        'date': ('time', eq),
+        'start_date': ('time', ge),
+        'end_date': ('time', le),
+        'distance_min': ('dist', ge),
+        'distance_max': ('dist', le),
+        'velocity_min': ('vrel', ge),
+        'velocity_max': ('vrel', le),
+        'diameter_min': ('diameter', ge),
+        'diameter_max': ('diameter', le),
+        'hazardous': ('hazardous', eq),
+    }
+
+    active = []
+    for key, value in criteria.items():
+        if value is None:
+            continue
+        if key not in column_mappings:
+            raise UnsupportedCriterionError(key)
+        column_name, op = column_mappings[key]
+        if column_name not in columns:
+            raise UnsupportedCriterionError(f"{key} needs a '{column_name}' column")
+        if column_name == 'time':
+            value = np.datetime64(value, 'D')
+        active.append((column_name, op, value))
+
+    kernel = _get_mask_kernel() if use_numba else None
+    if kernel is not None:
+        return _apply_filters_numba(kernel, columns, active)
+
+    mask = np.ones(len(columns['dist']), dtype=bool)
+    days = None
+
+    for column_name, op, value in active:
+        if column_name == 'time':
+            # Truncate to whole days once, shared by every date criterion.
+            if days is None:
+                days = columns['time'].astype('datetime64[D]')
+            mask &= op(days, value)
+        else:
+            mask &= op(columns[column_name], value)
+
+    return mask
+
+
+def _apply_filters_numba(kernel, columns, active):
+    """Evaluate validated column criteria with the compiled mask kernel.
+
+    Each column's criteria are collapsed into a closed `[low, high]` range
+    (an equality check is a range of one value), and columns without any
+    criteria are switched off with a flag so the kernel skips them.
+
+    :param kernel: The kernel from `_get_mask_kernel`.
+    :param columns: A dict of equal-length NumPy arrays.
+    :param active: A list of `(column_name, op, value)` criteria.
+    :return: A boolean NumPy array that is True for each matching approach.
+    """
+    import numpy as np
+
+    bounds = {
+        'time': [int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)],
+        'dist': [-np.inf, np.inf],
+        'vrel': [-np.inf, np.inf],
+        'diameter': [-np.inf, np.inf],
+    }
+    used = set()
+    hazardous = False
+
+    for column_name, op, value in active:
+        used.add(column_name)
+        if column_name == 'hazardous':
+            hazardous = bool(value)
+            continue
+        value = int(value.astype(np.int64)) if column_name == 'time' else float(value)
+        low, high = bounds[column_name]
+        if op is not le:
+            low = max(low, value)
+        if op is not ge:
+            high = min(high, value)
+        bounds[column_name] = [low, high]
+
+    empty = np.empty(0)
+    days = columns['time'].astype('datetime64[D]').view(np.int64) if 'time' in used else empty.astype(np.int64)
+
+    return kernel(
+        days, columns['dist'], columns['vrel'],
+        columns['diameter'] if 'diameter' in used else empty,
+        columns['hazardous'] if 'hazardous' in used else empty.astype(bool),
+        'time' in used, *bounds['time'],
+        *bounds['dist'], *bounds['vrel'],
+        'diameter' in used, *bounds['diameter'],
+        'hazardous' in used, hazardous,
+    )
 
 
 def limit(iterator, n=None):
@@ -281,15 +474,8 @@ def limit(iterator, n=None):
 
     :param iterator: An iterator of values.
     :param n: The maximum number of values to produce.
-    :yield: The first (at most) `n` values from the iterator.
+    :return: An iterable of the first (at most) `n` values from the iterator.
     """
-    if n is None or n == 0:
-        yield from iterator
-    else:
-        # Iterate through the iterator and yield up to n values
-        count = 0
-        for item in iterator:
-            if count >= n:
-                break
-            yield item
-            count += 1
+    if not n:
+        return iterator
+    return itertools.islice(iterator, n)
@@ -32,7 +32,9 @@ class NearEarthObject:
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
     """
-   
+
+    __slots__ = ('name', 'designation', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -41,30 +43,21 @@ class NearEarthObject:
         self.name = info.get('name')
         self.name = None if self.name in (' ', '') else self.name
         self.designation = info.get('designation')
-        self.diameter = self.isDigitorNone(info.get('diameter'))
+        # An unknown diameter is blank in the CSV file; store it (or anything
+        # unparseable) as NaN. Blanks are checked first to avoid the exception.
+        diameter = info.get('diameter')
+        if diameter in (None, '', ' '):
+            self.diameter = float('nan')
+        else:
+            try:
+                self.diameter = float(diameter)
+            except (TypeError, ValueError):
+                self.diameter = float('nan')
         self.hazardous = info.get('hazardous')
 
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
-    def isDigitorNone(self, value):
-        """
-        Convert a value to a float, returning NaN if conversion fails.
-
-        This method attempts to convert the provided value to a float. 
-        If the conversion raises a ValueError (indicating that the value 
-        is not a valid number), it returns NaN (Not a Number) instead.
-
-        :param value: The value to be converted to a float.
-        :return: The float representation of the value if successful, 
-                otherwise NaN.
-        """
-        try:
-            return float(value)
-        except ValueError:
-            return float('nan')
-        
-
     @property
     def fullname(self):
         """Return a representation of the full name of this NEO."""
@@ -107,16 +100,22 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('_designation', 'time', '_date', '_time_str', 'distance', 'velocity', 'neo')
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
+        The `distance` and `velocity` must already be floats; they're stored as given.
+
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         self._designation = info.get('designation')
         self.time = cd_to_datetime(info.get('time'))
+        # Cache the calendar date; date filters compare against it for every approach.
+        self._date = self.time.date()
+        # Formatted by `_formatted_time` the first time it's displayed.
+        self._time_str = None
         self.distance = info.get('distance')
-        if type(self.distance) is not float:
-            self.distance = float(self.distance)
         self.velocity = info.get('velocity')
         self.neo = info.get('neo')
 
@@ -135,9 +134,15 @@ class CloseApproach:
         in serialization to CSV and JSON files.
         """
         if self.neo.name:
-            return f"{datetime_to_str(self.time)}, {self._designation} ({self.neo.name})"
+            return f"{self._formatted_time()}, {self._designation} ({self.neo.name})"
         else:
-            return f"{datetime_to_str(self.time)})"
+            return self._formatted_time()
+
+    def _formatted_time(self):
+        """Return `datetime_to_str(self.time)`, formatting it only once per approach."""
+        if self._time_str is None:
+            self._time_str = datetime_to_str(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
@@ -14,8 +14,11 @@ import collections.abc
 import datetime
 import pathlib
 import math
+import tempfile
 import unittest
+import unittest.mock
 
+import extract
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
 
@@ -77,6 +80,44 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.diameter, 0.6)
         self.assertEqual(neo.hazardous, True)
 
+    def test_unparseable_diameter_is_nan(self):
+        for diameter in ('', ' ', None, 'n/a'):
+            with self.subTest(diameter=diameter):
+                neo = NearEarthObject(designation='X', diameter=diameter)
+                self.assertTrue(math.isnan(neo.diameter))
+
+
+class TestLoadNEOsUnparseableDiameter(unittest.TestCase):
+    ROWS = (
+        'pdes,name,diameter,pha',
+        '2101,Adonis,0.6,Y',
+        '4581,Asclepius,n/a,Y',
+        '2019 SC8,, ,N',
+        '433,Eros,,N',
+    )
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = pathlib.Path(tmpdir.name) / 'neos.csv'
+        self.path.write_text('\n'.join(self.ROWS) + '\n')
+
+    def assertLoadsWithNaN(self):
+        neos = {neo.designation: neo for neo in load_neos(self.path)}
+        self.assertEqual(len(neos), 4)
+        self.assertEqual(neos['2101'].diameter, 0.6)
+        self.assertTrue(neos['2101'].hazardous)
+        for designation in ('4581', '2019 SC8', '433'):
+            self.assertTrue(math.isnan(neos[designation].diameter))
+
+    @unittest.skipIf(extract.pv is None, "pyarrow is not installed")
+    def test_pyarrow_path(self):
+        self.assertLoadsWithNaN()
+
+    def test_csv_path(self):
+        with unittest.mock.patch.object(extract, 'pv', None):
+            self.assertLoadsWithNaN()
+
 
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
@@ -0,0 +1,59 @@
+"""Check that NASA-formatted calendar dates convert to datetimes.
+
+The `cd_to_datetime` function converts a single `cd` string into a `datetime`,
+and `cd_to_datetime64` converts a sequence of them into a NumPy array.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, cd_to_datetime64
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def test_converts_calendar_date(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'), datetime.datetime(2020, 12, 31, 12, 0))
+
+    def test_malformed_dates_raise_like_strptime(self):
+        for calendar_date in ('2020xJanx01T12:00', '2020-Jan-01T12:00', '2020-Jan-01 12-00',
+                              '2020-Foo-01 12:00', '2020-Feb-30 12:00', '2020-Jan-01 +1:00',
+                              '+020-Jan-01 01:00', '2020-Jan-0\u0661 01:00'):
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+    def test_falls_back_to_strptime_for_other_widths(self):
+        # strptime accepts unpadded fields, which the fixed-width fast path skips.
+        self.assertEqual(cd_to_datetime('2020-Jan-1 1:05'), datetime.datetime(2020, 1, 1, 1, 5))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestCdToDatetime64(unittest.TestCase):
+    def test_converts_calendar_dates(self):
+        dates = ['2020-Dec-31 12:00', '2020-Feb-29 23:59', '1900-Jan-01 00:11']
+        expected = numpy.array([cd_to_datetime(date) for date in dates], dtype='datetime64[m]')
+        self.assertEqual(cd_to_datetime64(dates).tolist(), expected.tolist())
+
+    def test_converts_empty_sequence(self):
+        self.assertEqual(len(cd_to_datetime64([])), 0)
+
+    def test_rejects_malformed_dates(self):
+        for dates in (['2020-Feb-30 00:00'], ['2020-Foo-01 00:00'], ['2020xJanx01T12:00'],
+                      ['2020-Jan-01 24:00'], ['2020-Jan-01 12:00', '2020-Jan-1 1:00']):
+            with self.subTest(dates=dates):
+                with self.assertRaises(ValueError):
+                    cd_to_datetime64(dates)
+
+
+if __name__ == '__main__':
+    unittest.main()
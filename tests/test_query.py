@@ -13,12 +13,25 @@ To run these tests from the project root, run::
 These tests should pass when Tasks 3a and 3b are complete.
 """
 import datetime
+import operator
 import pathlib
 import unittest
+import unittest.mock
 
-from database import NEODatabase
-from extract import load_neos, load_approaches
-from filters import create_filters
+from database import NEODatabase, ColumnarNEODatabase
+from extract import load_neos, load_approaches, load_approaches_soa
+import filters
+from filters import create_filters, apply_filters_soa, fuse_filters, AttributeFilter, DistFilter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -529,5 +542,110 @@ class TestQuery(unittest.TestCase):
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
 
+class TestFuseFilters(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.approaches = load_approaches(TEST_CAD_FILE)
+        NEODatabase(load_neos(TEST_NEO_FILE), cls.approaches)
+
+    def assertFusedMatchesAll(self, filters):
+        fused = fuse_filters(filters)
+        expected = [a for a in self.approaches if all(f(a) for f in filters)]
+        self.assertGreater(len(expected), 0)
+        self.assertEqual([a for a in self.approaches if fused(a)], expected)
+
+    def test_filter_overriding_get(self):
+        class NameLengthFilter(AttributeFilter):
+            @staticmethod
+            def get(approach):
+                return len(approach.neo.name or '')
+
+        self.assertIsNone(NameLengthFilter.expr)
+        self.assertFusedMatchesAll([DistFilter(operator.le, 0.1), NameLengthFilter(operator.ge, 4)])
+
+    def test_subclass_overriding_inherited_get(self):
+        class RoundedDistFilter(DistFilter):
+            @staticmethod
+            def get(approach):
+                return round(approach.distance, 1)
+
+        self.assertIsNone(RoundedDistFilter.expr)
+        self.assertFusedMatchesAll([RoundedDistFilter(operator.eq, 0.1)])
+
+    def test_operator_without_source_form(self):
+        self.assertFusedMatchesAll([DistFilter(operator.lt, 0.1), DistFilter(operator.ne, 0.05)])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestColumnarQuery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = NEODatabase(load_neos(TEST_NEO_FILE), load_approaches(TEST_CAD_FILE))
+        cls.columnar_db = ColumnarNEODatabase(load_neos(TEST_NEO_FILE), load_approaches_soa(TEST_CAD_FILE))
+
+    def assertSameResults(self, **criteria):
+        expected = [(a._designation, a.time, a.distance, a.velocity)
+                    for a in self.db.query(create_filters(**criteria))]
+        received = [(a._designation, a.time, a.distance, a.velocity)
+                    for a in self.columnar_db.query_criteria(criteria)]
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(expected, received)
+
+    def test_query_all(self):
+        self.assertSameResults()
+
+    def test_query_on_date(self):
+        self.assertSameResults(date=datetime.date(2020, 3, 2))
+
+    def test_query_date_range_distance_and_velocity(self):
+        self.assertSameResults(start_date=datetime.date(2020, 3, 1), end_date=datetime.date(2020, 6, 1),
+                               distance_max=0.1, velocity_min=10)
+
+    def test_query_diameter_and_hazardous(self):
+        self.assertSameResults(diameter_min=0.1, hazardous=True)
+        self.assertSameResults(diameter_max=1.0, hazardous=False)
+
+    def test_query_limit(self):
+        results = list(self.columnar_db.query_criteria({'hazardous': True}, n=3))
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(approach.neo.hazardous for approach in results))
+
+    def test_neo_lookups(self):
+        self.assertEqual(self.columnar_db.get_neo_by_designation('2101').name, 'Adonis')
+        self.assertEqual(self.columnar_db.get_neo_by_name('Adonis').designation, '2101')
+
+
+@unittest.skipIf(numpy is None or numba is None, "numpy and numba are not installed")
+class TestColumnarMaskPaths(unittest.TestCase):
+    CRITERIA = (
+        {},
+        {'date': datetime.date(2020, 3, 2)},
+        {'start_date': datetime.date(2020, 3, 1), 'end_date': datetime.date(2020, 6, 1)},
+        {'date': datetime.date(2020, 3, 2), 'start_date': datetime.date(2020, 4, 1)},
+        {'distance_min': 0.05, 'distance_max': 0.5, 'velocity_min': 5, 'velocity_max': 25},
+        {'diameter_min': 0.1, 'hazardous': True},
+        {'diameter_max': 1.0, 'hazardous': False},
+        {'start_date': datetime.date(2020, 1, 1), 'distance_max': 0.1, 'velocity_min': 10,
+         'diameter_min': 0.05, 'diameter_max': 2, 'hazardous': False},
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        db = ColumnarNEODatabase(load_neos(TEST_NEO_FILE), load_approaches_soa(TEST_CAD_FILE))
+        cls.columns = db._columns
+
+    def test_kernel_and_numpy_masks_agree(self):
+        for criteria in self.CRITERIA:
+            with self.subTest(criteria=criteria):
+                kernel_mask = apply_filters_soa(self.columns, criteria, use_numba=True)
+                numpy_mask = apply_filters_soa(self.columns, criteria)
+                self.assertEqual(kernel_mask.tolist(), numpy_mask.tolist())
+
+    def test_numpy_path_is_the_default(self):
+        with unittest.mock.patch.object(filters, '_get_mask_kernel') as get_kernel:
+            apply_filters_soa(self.columns, {'distance_max': 0.1})
+        get_kernel.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -21,10 +21,12 @@ import datetime
 import io
 import json
 import pathlib
+import tempfile
 import unittest
 import unittest.mock
 
 
+import write
 from extract import load_neos, load_approaches
 from database import NEODatabase
 from write import write_to_csv, write_to_json
@@ -226,5 +228,27 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
 
+@unittest.skipUnless(write._USE_ORJSON, "orjson with Fragment support is not installed")
+class TestWriteToJSONEncoders(unittest.TestCase):
+    def test_orjson_and_stdlib_output_are_identical(self):
+        results = build_results(len(tuple(load_approaches(TEST_CAD_FILE))))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orjson_path = pathlib.Path(tmpdir) / 'orjson.json'
+            stdlib_path = pathlib.Path(tmpdir) / 'stdlib.json'
+            write_to_json(results, orjson_path)
+            with unittest.mock.patch.object(write, '_USE_ORJSON', False):
+                write_to_json(results, stdlib_path)
+            self.assertEqual(orjson_path.read_bytes(), stdlib_path.read_bytes())
+
+    def test_empty_output_is_identical(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orjson_path = pathlib.Path(tmpdir) / 'orjson.json'
+            stdlib_path = pathlib.Path(tmpdir) / 'stdlib.json'
+            write_to_json([], orjson_path)
+            with unittest.mock.patch.object(write, '_USE_ORJSON', False):
+                write_to_json([], stdlib_path)
+            self.assertEqual(orjson_path.read_bytes(), stdlib_path.read_bytes())
+
+
 if __name__ == '__main__':
     unittest.main()
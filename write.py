@@ -12,9 +12,67 @@ import csv
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson is only used if it supports raw fragments (3.9+), which `_orjson_float`
+# needs to match the stdlib encoder's output; otherwise fall back to the stdlib.
+_USE_ORJSON = hasattr(orjson, "Fragment")
+_NAN_FRAGMENT = orjson.Fragment(b"NaN") if _USE_ORJSON else None
+
 # Paths to the root of the project.
 PROJECT_ROOT = Path(__file__).parent.resolve()
 
+
+def _serialize_row(line):
+    """
+    Serialize a `CloseApproach` and its NEO for one output row.
+
+    :param line: A CloseApproach object linked to its NearEarthObject.
+    :return: A tuple of the approach's and the NEO's serialized dictionaries.
+    """
+    return line.serialize(), line.neo.serialize()
+
+
+def _orjson_float(value):
+    """
+    Prepare a float for orjson so it's written exactly as the stdlib encoder would.
+
+    orjson refuses to encode NaN and infinities, and writes very small and very
+    large numbers without an exponent where the stdlib uses one. Those values
+    are passed through as raw fragments of the stdlib's spelling.
+
+    :param value: A float to encode.
+    :return: The float itself, or an `orjson.Fragment` of its stdlib spelling.
+    """
+    if value == 0 or 1e-4 <= abs(value) < 1e16:
+        return value
+    if value != value:
+        return _NAN_FRAGMENT
+    return orjson.Fragment(json.dumps(value).encode())
+
+
+def _nest_orjson_element(element):
+    """
+    Re-indent an orjson `OPT_INDENT_2` element as a four-space-indented list item.
+
+    A row's layout is fixed: lines are indented by 0, 2 or 4 spaces, and
+    strings never contain a raw newline or tab (both are escaped). So the
+    deepest level is first marked with a tab, and each level is then widened
+    with plain string replacements - much cheaper than a regex per row.
+
+    :param element: One row, as encoded by `orjson.dumps(row, option=OPT_INDENT_2)`.
+    :return: The row, as `json.dumps(row, indent=4)` nested one level deep would be.
+    """
+    return ("    " + element
+            .replace("\n    ", "\n\t")
+            .replace("\n  ", "\n        ")
+            .replace("\n}", "\n    }")
+            .replace("\n\t", "\n            "))
+
+
 def write_to_csv(ca_data, filename):
     """
     Iterate `CloseApproach` objects to a CSV file.
@@ -33,21 +91,23 @@ def write_to_csv(ca_data, filename):
    
     # Open the file and prepare the CSV writer
     with open(filename, "w", newline="") as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(outfile)
+        writer.writerow(fieldnames)
         
         for line in ca_data:
             # Serialize both the CloseApproach and the NEO
-            approach_data = line.serialize()
-            neo_data = line.neo.serialize()
-            
-            # Combine the dictionaries and process fields
-            content = {**approach_data, **neo_data}
-            content["name"] = content.get("name", "")
-            content["potentially_hazardous"] = "True" if content.get("potentially_hazardous", False) else "False"
+            approach_data, neo_data = _serialize_row(line)
             
-            # Write the row to the CSV file
-            writer.writerow(content)
+            # Write the row to the CSV file, in `fieldnames` order
+            writer.writerow((
+                approach_data["datetime_utc"],
+                approach_data["distance_au"],
+                approach_data["velocity_km_s"],
+                neo_data["designation"],
+                neo_data["name"],
+                neo_data["diameter_km"],
+                "True" if neo_data["potentially_hazardous"] else "False",
+            ))
 
 def write_to_json(ca_data, filename):
     """
@@ -64,22 +124,39 @@ def write_to_json(ca_data, filename):
     if filename is None:
         filename = 'CloseApproach.json'  # Or some other default path
 
-    data = [
-        {
-            "datetime_utc": line.serialize().get("datetime_utc", ""),
-            "distance_au": line.serialize().get("distance_au", 0.0),
-            "velocity_km_s": line.serialize().get("velocity_km_s", 0.0),
-            "neo": {
-                "designation": line.neo.serialize().get("designation", ""),
-                "name": line.neo.serialize().get("name", ""),
-                "diameter_km": line.neo.serialize().get("diameter_km", float('nan')),
-                "potentially_hazardous": line.neo.serialize().get("potentially_hazardous", False)
+    # Stream one element at a time instead of building the whole list first.
+    with open(filename, "w", encoding="utf-8") as outfile:
+        outfile.write("[")
+        separator = "\n"
+        for line in ca_data:
+            # Serialize each object once per row rather than once per field.
+            approach_data, neo_data = _serialize_row(line)
+            distance = approach_data.get("distance_au", 0.0)
+            velocity = approach_data.get("velocity_km_s", 0.0)
+            diameter = neo_data.get("diameter_km", float('nan'))
+            if _USE_ORJSON:
+                distance = _orjson_float(distance)
+                velocity = _orjson_float(velocity)
+                diameter = _orjson_float(diameter)
+            row = {
+                "datetime_utc": approach_data.get("datetime_utc", ""),
+                "distance_au": distance,
+                "velocity_km_s": velocity,
+                "neo": {
+                    "designation": neo_data.get("designation", ""),
+                    "name": neo_data.get("name", ""),
+                    "diameter_km": diameter,
+                    "potentially_hazardous": neo_data.get("potentially_hazardous", False)
+                }
             }
-        }
-        for line in ca_data
-    ]
 
-    # Write the data to the JSON file
-    with open(filename, "w", encoding="utf-8") as outfile:
-        json.dump(data, outfile, indent=4, ensure_ascii=False)
+            if _USE_ORJSON:
+                element = _nest_orjson_element(
+                    orjson.dumps(row, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            else:
+                # Nest the element one level deep inside the enclosing list.
+                element = "    " + json.dumps(row, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+            outfile.write(separator + element)
+            separator = ",\n"
 
+        outfile.write("]" if separator == "\n" else "\n]")